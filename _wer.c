@@ -0,0 +1,142 @@
+/*
+ * Batch word-level Levenshtein distance for evaluate_wer.py
+ *
+ * Build in place with:  python setup.py build_ext --inplace
+ *
+ * wer_batch(ref_offsets, ref_tokens, hyp_offsets, hyp_tokens, n_pairs, out)
+ *   ref_offsets/hyp_offsets: int32 buffers of n_pairs + 1 sentence offsets
+ *   ref_tokens/hyp_tokens:   uint16 buffers of concatenated token ids
+ *   out:                     writable int32 buffer, receives n_pairs edit counts
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+static uint16_t edit_distance(const uint16_t *ref, int32_t n_ref,
+                              const uint16_t *hyp, int32_t n_hyp,
+                              uint16_t *prev, uint16_t *curr)
+{
+    for (int32_t j = 0; j <= n_hyp; j++)
+        prev[j] = (uint16_t)j;
+
+    for (int32_t i = 1; i <= n_ref; i++) {
+        curr[0] = (uint16_t)i;
+        for (int32_t j = 1; j <= n_hyp; j++) {
+            uint16_t sub = prev[j - 1] + (ref[i - 1] != hyp[j - 1]);
+            uint16_t del = prev[j] + 1;
+            uint16_t ins = curr[j - 1] + 1;
+            uint16_t best = sub < del ? sub : del;
+            curr[j] = best < ins ? best : ins;
+        }
+        uint16_t *tmp = prev;
+        prev = curr;
+        curr = tmp;
+    }
+    return prev[n_hyp];
+}
+
+
+static int check_offsets(const Py_buffer *offsets, const Py_buffer *tokens,
+                         Py_ssize_t n_pairs, const char *name, int32_t *max_len)
+{
+    const int32_t *off = (const int32_t *)offsets->buf;
+    Py_ssize_t n_tokens = tokens->len / (Py_ssize_t)sizeof(uint16_t);
+
+    if (offsets->len != (n_pairs + 1) * (Py_ssize_t)sizeof(int32_t)) {
+        PyErr_Format(PyExc_ValueError, "%s must hold n_pairs + 1 int32 values", name);
+        return -1;
+    }
+    for (Py_ssize_t k = 0; k < n_pairs; k++) {
+        if (off[k] < 0 || off[k] > off[k + 1] || off[k + 1] > n_tokens) {
+            PyErr_Format(PyExc_ValueError, "%s is not a valid offset array", name);
+            return -1;
+        }
+        if (off[k + 1] - off[k] > *max_len)
+            *max_len = off[k + 1] - off[k];
+    }
+    /* DP cells reach max(n_ref, n_hyp) and prev[j] + 1 must not wrap */
+    if (*max_len >= UINT16_MAX) {
+        PyErr_Format(PyExc_ValueError, "%s: sentence must be shorter than %d tokens", name, UINT16_MAX);
+        return -1;
+    }
+    return 0;
+}
+
+
+static PyObject *wer_batch(PyObject *self, PyObject *args)
+{
+    Py_buffer ref_offsets, ref_tokens, hyp_offsets, hyp_tokens, out;
+    Py_ssize_t n_pairs;
+    int32_t max_ref = 0, max_hyp = 0;
+    uint16_t *rows = NULL;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*y*y*y*nw*", &ref_offsets, &ref_tokens,
+                          &hyp_offsets, &hyp_tokens, &n_pairs, &out))
+        return NULL;
+
+    if (n_pairs < 0 || out.len != n_pairs * (Py_ssize_t)sizeof(int32_t)) {
+        PyErr_SetString(PyExc_ValueError, "out must hold n_pairs int32 values");
+        goto done;
+    }
+    if (check_offsets(&ref_offsets, &ref_tokens, n_pairs, "ref_offsets", &max_ref) < 0 ||
+        check_offsets(&hyp_offsets, &hyp_tokens, n_pairs, "hyp_offsets", &max_hyp) < 0)
+        goto done;
+
+    /* Two DP rows sized for the longest hypothesis, reused for every pair */
+    rows = (uint16_t *)malloc(2 * ((size_t)max_hyp + 1) * sizeof(uint16_t));
+    if (rows == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    {
+        const int32_t *r_off = (const int32_t *)ref_offsets.buf;
+        const int32_t *h_off = (const int32_t *)hyp_offsets.buf;
+        const uint16_t *r_tok = (const uint16_t *)ref_tokens.buf;
+        const uint16_t *h_tok = (const uint16_t *)hyp_tokens.buf;
+        int32_t *dst = (int32_t *)out.buf;
+
+        Py_BEGIN_ALLOW_THREADS
+        for (Py_ssize_t k = 0; k < n_pairs; k++) {
+            dst[k] = edit_distance(r_tok + r_off[k], r_off[k + 1] - r_off[k],
+                                   h_tok + h_off[k], h_off[k + 1] - h_off[k],
+                                   rows, rows + max_hyp + 1);
+        }
+        Py_END_ALLOW_THREADS
+    }
+
+    result = Py_None;
+    Py_INCREF(result);
+
+done:
+    free(rows);
+    PyBuffer_Release(&ref_offsets);
+    PyBuffer_Release(&ref_tokens);
+    PyBuffer_Release(&hyp_offsets);
+    PyBuffer_Release(&hyp_tokens);
+    PyBuffer_Release(&out);
+    return result;
+}
+
+
+static PyMethodDef wer_methods[] = {
+    {"wer_batch", wer_batch, METH_VARARGS,
+     "wer_batch(ref_offsets, ref_tokens, hyp_offsets, hyp_tokens, n_pairs, out)\n"
+     "Write the word-level edit distance of every ref/hyp pair into out."},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef wer_module = {
+    PyModuleDef_HEAD_INIT, "_wer", "Batch word-level Levenshtein distance", -1, wer_methods
+};
+
+
+PyMODINIT_FUNC PyInit__wer(void)
+{
+    return PyModule_Create(&wer_module);
+}
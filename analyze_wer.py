@@ -6,66 +6,215 @@ Provides detailed statistical analysis with reliability metrics
 
 import os
 import glob
+import hashlib
 import argparse
 from pathlib import Path
-import pandas as pd
+import polars as pl
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 import json
 
+try:
+    from crick import TDigest
+except ImportError:  # crick is optional, quantiles are then always exact
+    TDigest = None
 
-def load_wer_csv(filepath: str) -> pd.DataFrame:
-    """Load WER CSV file"""
-    try:
-        df = pd.read_csv(filepath, encoding='utf-8')
-        return df
-    except Exception as e:
-        print(f"Error loading {filepath}: {e}")
-        return pd.DataFrame()
+# Bump whenever calculate_statistics changes so cached statistics are invalidated
+CACHE_VERSION = 3
+
+# Rows per chunk when streaming the wer column of a CSV
+CHUNK_SIZE = 1_000_000
+
+# Above this many values quantiles are estimated with a t-digest (if crick is installed)
+EXACT_QUANTILE_MAX_COUNT = 100_000
+
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+# Upper WER bounds of the excellent/good/fair buckets; anything above is poor
+PERFORMANCE_BUCKET_EDGES = [10.0, 20.0, 30.0]
+
+
+def load_wer_chunks(filepath: str, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """
+    Stream the wer column of a WER CSV file in chunks of at most chunk_size rows
+    Text columns are never parsed; WER is read as float32, it only has 2-decimal precision
+    Raises polars.exceptions.ColumnNotFoundError if the file has no wer column
+    Requires polars >= 1.34 for LazyFrame.collect_batches
+    """
+    lf = pl.scan_csv(filepath, schema_overrides={'wer': pl.Float32}, encoding='utf8')
+    # Check the header up front so a non-WER CSV fails before any batch is collected
+    if 'wer' not in lf.collect_schema().names():
+        raise pl.exceptions.ColumnNotFoundError(f'no "wer" column in {filepath}')
+    
+    batches = lf.select('wer').collect_batches(chunk_size=chunk_size)
+    for batch in batches:
+        yield batch['wer'].to_numpy()
+
+
+def _sorted_quantiles(sorted_values: np.ndarray, qs: List[float]) -> np.ndarray:
+    """
+    Linearly interpolated quantiles of an already sorted array
+    (same definition as pandas/NumPy 'linear')
+    """
+    pos = (sorted_values.size - 1) * np.asarray(qs)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, sorted_values.size - 1)
+    return sorted_values[lo] + (pos - lo) * (sorted_values[hi] - sorted_values[lo])
+
+
+def _central_moments(a: np.ndarray) -> Tuple[int, float, float, float, float]:
+    """
+    (n, mean, M2, M3, M4) where Mk is the sum of (x - mean)**k,
+    accumulated in float64 even when the values are float32
+    """
+    mean = a.sum(dtype=np.float64) / a.size
+    d = a - mean
+    d2 = d * d
+    return a.size, mean, d2.sum(), (d2 * d).sum(), (d2 * d2).sum()
+
+
+def _merge_moments(x: Tuple[int, float, float, float, float],
+                   y: Tuple[int, float, float, float, float]) -> Tuple[int, float, float, float, float]:
+    """
+    Combine the central moments of two chunks (pairwise update of Chan et al. / Pebay)
+    """
+    n_a, mean_a, m2_a, m3_a, m4_a = x
+    n_b, mean_b, m2_b, m3_b, m4_b = y
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+    m3 = (m3_a + m3_b
+          + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+          + 3 * delta * (n_a * m2_b - n_b * m2_a) / n)
+    m4 = (m4_a + m4_b
+          + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+          + 6 * delta ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) / n ** 2
+          + 4 * delta * (n_a * m3_b - n_b * m3_a) / n)
+    return n, mean, m2, m3, m4
 
 
-def calculate_statistics(wer_values: pd.Series) -> Dict:
+def calculate_statistics(wer_values: pl.Series) -> Dict:
     """
     Calculate comprehensive statistics for WER values
     """
+    return calculate_streaming_statistics([wer_values.to_numpy()])
+
+
+def calculate_streaming_statistics(chunks: Iterable[np.ndarray]) -> Dict:
+    """
+    Calculate comprehensive statistics for WER values arriving in chunks
+    Each chunk is sorted once; its central moments and performance bucket
+    counts are merged into running totals, and the sorted chunks are kept
+    (wer values only) for the exact quantiles
+    Beyond EXACT_QUANTILE_MAX_COUNT values the chunks are folded into a
+    t-digest instead, when crick is available
+    Missing values (NaN) are skipped as pandas does, but still counted in
+    'count' and in the bucket percentage denominators
+    Returns {} if there are no non-missing values
+    """
+    moments = None
+    bucket_counts = np.zeros(len(PERFORMANCE_BUCKET_EDGES) + 1, dtype=np.int64)
+    min_wer, max_wer = float('inf'), float('-inf')
+    sorted_chunks = []
+    digest = None
+    row_count = 0
+    
+    for chunk in chunks:
+        row_count += chunk.size
+        a = np.sort(chunk[~np.isnan(chunk)])
+        if a.size == 0:
+            continue
+        chunk_moments = _central_moments(a)
+        moments = chunk_moments if moments is None else _merge_moments(moments, chunk_moments)
+        min_wer, max_wer = min(min_wer, float(a[0])), max(max_wer, float(a[-1]))
+        
+        # Bucket sizes are differences of the "<= edge" counts on the sorted chunk
+        bucket_counts += np.diff(np.searchsorted(a, PERFORMANCE_BUCKET_EDGES, side='right'),
+                                 prepend=0, append=a.size)
+        
+        if digest is not None:
+            digest.update(a)
+        else:
+            sorted_chunks.append(a)
+            if TDigest is not None and moments[0] > EXACT_QUANTILE_MAX_COUNT:
+                digest = TDigest()
+                for kept in sorted_chunks:
+                    digest.update(kept)
+                sorted_chunks = []
+    
+    if moments is None:
+        return {}
+    
+    n, mean, m2, m3, m4 = moments
+    if digest is not None:
+        p5, q1, median, q3, p95 = digest.quantile(QUANTILES)
+    else:
+        a = sorted_chunks[0] if len(sorted_chunks) == 1 else np.sort(np.concatenate(sorted_chunks))
+        p5, q1, median, q3, p95 = _sorted_quantiles(a, QUANTILES)
+    nan = float('nan')
+    
+    variance = m2 / (n - 1) if n > 1 else nan
+    std = variance ** 0.5
+    sem = std / n ** 0.5
+    
+    # Bias-corrected skewness and excess kurtosis (as pandas computes them)
+    if n < 3:
+        skewness = nan
+    elif m2 == 0:
+        skewness = 0.0
+    else:
+        skewness = n * (n - 1) ** 0.5 / (n - 2) * (m3 / m2 ** 1.5)
+    if n < 4:
+        kurtosis = nan
+    elif m2 == 0:
+        kurtosis = 0.0
+    else:
+        kurtosis = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                    - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+    
+    excellent_count, good_count, fair_count, poor_count = bucket_counts.tolist()
+    excellent_pct, good_pct, fair_pct, poor_pct = (bucket_counts / row_count * 100.0).tolist()
+    
     stats = {
         # Basic statistics
-        'count': int(len(wer_values)),
-        'mean': float(wer_values.mean()),
-        'median': float(wer_values.median()),
-        'std': float(wer_values.std()),
-        'variance': float(wer_values.var()),
-        'min': float(wer_values.min()),
-        'max': float(wer_values.max()),
-        'range': float(wer_values.max() - wer_values.min()),
+        'count': int(row_count),
+        'mean': float(mean),
+        'median': float(median),
+        'std': float(std),
+        'variance': float(variance),
+        'min': float(min_wer),
+        'max': float(max_wer),
+        'range': float(max_wer - min_wer),
         
         # Percentiles
-        'q1': float(wer_values.quantile(0.25)),
-        'q3': float(wer_values.quantile(0.75)),
-        'iqr': float(wer_values.quantile(0.75) - wer_values.quantile(0.25)),
-        'p5': float(wer_values.quantile(0.05)),
-        'p95': float(wer_values.quantile(0.95)),
+        'q1': float(q1),
+        'q3': float(q3),
+        'iqr': float(q3 - q1),
+        'p5': float(p5),
+        'p95': float(p95),
         
         # Distribution metrics
-        'skewness': float(wer_values.skew()),
-        'kurtosis': float(wer_values.kurtosis()),
+        'skewness': float(skewness),
+        'kurtosis': float(kurtosis),
         
         # Reliability metrics
-        'cv': float((wer_values.std() / wer_values.mean()) * 100) if wer_values.mean() > 0 else 0,  # Coefficient of Variation
-        'sem': float(wer_values.sem()),  # Standard Error of Mean
-        'ci_95_lower': float(wer_values.mean() - 1.96 * wer_values.sem()),  # 95% Confidence Interval
-        'ci_95_upper': float(wer_values.mean() + 1.96 * wer_values.sem()),
+        'cv': float((std / mean) * 100) if mean > 0 else 0,  # Coefficient of Variation
+        'sem': float(sem),  # Standard Error of Mean
+        'ci_95_lower': float(mean - 1.96 * sem),  # 95% Confidence Interval
+        'ci_95_upper': float(mean + 1.96 * sem),
         
         # Performance categories
-        'excellent_count': int((wer_values <= 10).sum()),  # WER <= 10%
-        'good_count': int(((wer_values > 10) & (wer_values <= 20)).sum()),  # 10% < WER <= 20%
-        'fair_count': int(((wer_values > 20) & (wer_values <= 30)).sum()),  # 20% < WER <= 30%
-        'poor_count': int((wer_values > 30).sum()),  # WER > 30%
+        'excellent_count': excellent_count,  # WER <= 10%
+        'good_count': good_count,  # 10% < WER <= 20%
+        'fair_count': fair_count,  # 20% < WER <= 30%
+        'poor_count': poor_count,  # WER > 30%
         
-        'excellent_pct': float((wer_values <= 10).sum() / len(wer_values) * 100),
-        'good_pct': float(((wer_values > 10) & (wer_values <= 20)).sum() / len(wer_values) * 100),
-        'fair_pct': float(((wer_values > 20) & (wer_values <= 30)).sum() / len(wer_values) * 100),
-        'poor_pct': float((wer_values > 30).sum() / len(wer_values) * 100),
+        'excellent_pct': excellent_pct,
+        'good_pct': good_pct,
+        'fair_pct': fair_pct,
+        'poor_pct': poor_pct,
     }
     
     # Round all float values
@@ -76,25 +225,69 @@ def calculate_statistics(wer_values: pd.Series) -> Dict:
     return stats
 
 
-def analyze_single_model(csv_file: str) -> Dict:
+def _cache_file(csv_file: str, cache_dir: str) -> Optional[str]:
+    """
+    Cache path for a CSV's statistics, keyed by path, mtime, size, CACHE_VERSION
+    and the quantile backend (crick's t-digest gives approximate quantiles on large CSVs)
+    Returns None if the CSV cannot be stat'ed
+    """
+    try:
+        st = os.stat(csv_file)
+    except OSError:
+        return None
+    key = (f"{CACHE_VERSION}|{TDigest is not None}|{EXACT_QUANTILE_MAX_COUNT}|"
+           f"{os.path.abspath(csv_file)}|{st.st_mtime_ns}|{st.st_size}")
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def analyze_single_model(csv_file: str, cache_dir: Optional[str] = None) -> Dict:
     """
     Analyze a single model's WER CSV file
+    The wer column is streamed in chunks, so peak memory does not grow with the text columns
+    With cache_dir, statistics are reused until the CSV changes
     """
-    df = load_wer_csv(csv_file)
+    cache_file = _cache_file(csv_file, cache_dir) if cache_dir else None
     
-    if df.empty or 'wer' not in df.columns:
-        return {}
+    stats = None
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except (ValueError, OSError):
+            # Truncated or unreadable cache file: recompute and overwrite it
+            stats = None
+    
+    if stats is None:
+        try:
+            stats = calculate_streaming_statistics(load_wer_chunks(csv_file))
+        except pl.exceptions.ColumnNotFoundError:
+            # Not a WER CSV
+            return {}
+        except AttributeError:
+            # An API mismatch (e.g. polars < 1.34), not a problem with this file
+            raise
+        except Exception as e:
+            print(f"Error loading {csv_file}: {e}")
+            return {}
+        
+        if not stats:
+            return {}
+        
+        if cache_file:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(stats, f)
     
     model_name = Path(csv_file).stem.replace('_wer', '')
     
-    stats = calculate_statistics(df['wer'])
     stats['model_name'] = model_name
     stats['csv_file'] = csv_file
     
     return stats
 
 
-def compare_models(csv_files: List[str]) -> pd.DataFrame:
+def compare_models(csv_files: List[str], cache_dir: Optional[str] = None) -> pl.DataFrame:
     """
     Compare statistics across multiple models
     Returns DataFrame with models as rows and metrics as columns
@@ -102,115 +295,120 @@ def compare_models(csv_files: List[str]) -> pd.DataFrame:
     all_stats = []
     
     for csv_file in csv_files:
-        stats = analyze_single_model(csv_file)
+        stats = analyze_single_model(csv_file, cache_dir)
         if stats:
             all_stats.append(stats)
     
     if not all_stats:
-        return pd.DataFrame()
+        return pl.DataFrame()
     
-    df = pd.DataFrame(all_stats)
+    df = pl.from_dicts(all_stats, infer_schema_length=None)
     
     # Reorder columns for better readability
     priority_cols = ['model_name', 'count', 'mean', 'median', 'std', 'min', 'max']
     other_cols = [col for col in df.columns if col not in priority_cols and col != 'csv_file']
-    df = df[priority_cols + other_cols + ['csv_file']]
+    df = df.select(priority_cols + other_cols + ['csv_file'])
     
     return df
 
 
-def generate_report(comparison_df: pd.DataFrame, output_dir: str):
+def generate_report(comparison_df: pl.DataFrame, output_dir: str):
     """
     Generate detailed analysis report
     """
     report_file = os.path.join(output_dir, 'wer_analysis_report.txt')
     
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("=" * 80 + "\n")
-        f.write("WER ANALYSIS REPORT\n")
-        f.write("=" * 80 + "\n\n")
+    # Accumulate the report and write it in one call
+    parts = []
+    
+    parts.append("=" * 80 + "\n")
+    parts.append("WER ANALYSIS REPORT\n")
+    parts.append("=" * 80 + "\n\n")
+    
+    for row in comparison_df.to_dicts():
+        model_name = row['model_name']
+        
+        parts.append(f"\n{'=' * 80}\n")
+        parts.append(f"MODEL: {model_name}\n")
+        parts.append(f"{'=' * 80}\n\n")
+        
+        parts.append("BASIC STATISTICS:\n")
+        parts.append("-" * 40 + "\n")
+        parts.append(f"  Sample Size:        {row['count']}\n")
+        parts.append(f"  Mean WER:           {row['mean']:.2f}%\n")
+        parts.append(f"  Median WER:         {row['median']:.2f}%\n")
+        parts.append(f"  Std Deviation:      {row['std']:.2f}%\n")
+        parts.append(f"  Min WER:            {row['min']:.2f}%\n")
+        parts.append(f"  Max WER:            {row['max']:.2f}%\n")
+        parts.append(f"  Range:              {row['range']:.2f}%\n\n")
+        
+        parts.append("DISTRIBUTION:\n")
+        parts.append("-" * 40 + "\n")
+        parts.append(f"  Q1 (25th percentile):   {row['q1']:.2f}%\n")
+        parts.append(f"  Q3 (75th percentile):   {row['q3']:.2f}%\n")
+        parts.append(f"  IQR:                    {row['iqr']:.2f}%\n")
+        parts.append(f"  5th percentile:         {row['p5']:.2f}%\n")
+        parts.append(f"  95th percentile:        {row['p95']:.2f}%\n")
+        parts.append(f"  Skewness:               {row['skewness']:.4f}\n")
+        parts.append(f"  Kurtosis:               {row['kurtosis']:.4f}\n\n")
+        
+        parts.append("RELIABILITY METRICS:\n")
+        parts.append("-" * 40 + "\n")
+        parts.append(f"  Coefficient of Variation (CV): {row['cv']:.2f}%\n")
+        parts.append(f"  Standard Error of Mean (SEM):  {row['sem']:.4f}\n")
+        parts.append(f"  95% Confidence Interval:       [{row['ci_95_lower']:.2f}%, {row['ci_95_upper']:.2f}%]\n\n")
         
-        for _, row in comparison_df.iterrows():
-            model_name = row['model_name']
-            
-            f.write(f"\n{'=' * 80}\n")
-            f.write(f"MODEL: {model_name}\n")
-            f.write(f"{'=' * 80}\n\n")
-            
-            f.write("BASIC STATISTICS:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"  Sample Size:        {row['count']}\n")
-            f.write(f"  Mean WER:           {row['mean']:.2f}%\n")
-            f.write(f"  Median WER:         {row['median']:.2f}%\n")
-            f.write(f"  Std Deviation:      {row['std']:.2f}%\n")
-            f.write(f"  Min WER:            {row['min']:.2f}%\n")
-            f.write(f"  Max WER:            {row['max']:.2f}%\n")
-            f.write(f"  Range:              {row['range']:.2f}%\n\n")
-            
-            f.write("DISTRIBUTION:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"  Q1 (25th percentile):   {row['q1']:.2f}%\n")
-            f.write(f"  Q3 (75th percentile):   {row['q3']:.2f}%\n")
-            f.write(f"  IQR:                    {row['iqr']:.2f}%\n")
-            f.write(f"  5th percentile:         {row['p5']:.2f}%\n")
-            f.write(f"  95th percentile:        {row['p95']:.2f}%\n")
-            f.write(f"  Skewness:               {row['skewness']:.4f}\n")
-            f.write(f"  Kurtosis:               {row['kurtosis']:.4f}\n\n")
-            
-            f.write("RELIABILITY METRICS:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"  Coefficient of Variation (CV): {row['cv']:.2f}%\n")
-            f.write(f"  Standard Error of Mean (SEM):  {row['sem']:.4f}\n")
-            f.write(f"  95% Confidence Interval:       [{row['ci_95_lower']:.2f}%, {row['ci_95_upper']:.2f}%]\n\n")
-            
-            f.write("PERFORMANCE BREAKDOWN:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"  Excellent (WER ≤ 10%):  {row['excellent_count']:4d} samples ({row['excellent_pct']:5.1f}%)\n")
-            f.write(f"  Good (10% < WER ≤ 20%): {row['good_count']:4d} samples ({row['good_pct']:5.1f}%)\n")
-            f.write(f"  Fair (20% < WER ≤ 30%): {row['fair_count']:4d} samples ({row['fair_pct']:5.1f}%)\n")
-            f.write(f"  Poor (WER > 30%):       {row['poor_count']:4d} samples ({row['poor_pct']:5.1f}%)\n\n")
-            
-            f.write("INTERPRETATION:\n")
-            f.write("-" * 40 + "\n")
-            
-            # CV interpretation
-            if row['cv'] < 15:
-                cv_interp = "Low variability - highly consistent performance"
-            elif row['cv'] < 30:
-                cv_interp = "Moderate variability - reasonably consistent"
-            else:
-                cv_interp = "High variability - inconsistent performance"
-            f.write(f"  CV: {cv_interp}\n")
-            
-            # Skewness interpretation
-            if abs(row['skewness']) < 0.5:
-                skew_interp = "Approximately symmetric distribution"
-            elif row['skewness'] > 0:
-                skew_interp = "Right-skewed - more samples with low WER"
-            else:
-                skew_interp = "Left-skewed - more samples with high WER"
-            f.write(f"  Skewness: {skew_interp}\n")
-            
-            # Overall performance
-            if row['mean'] <= 10:
-                overall = "EXCELLENT"
-            elif row['mean'] <= 20:
-                overall = "GOOD"
-            elif row['mean'] <= 30:
-                overall = "FAIR"
-            else:
-                overall = "POOR"
-            f.write(f"  Overall Rating: {overall}\n\n")
+        parts.append("PERFORMANCE BREAKDOWN:\n")
+        parts.append("-" * 40 + "\n")
+        parts.append(f"  Excellent (WER ≤ 10%):  {row['excellent_count']:4d} samples ({row['excellent_pct']:5.1f}%)\n")
+        parts.append(f"  Good (10% < WER ≤ 20%): {row['good_count']:4d} samples ({row['good_pct']:5.1f}%)\n")
+        parts.append(f"  Fair (20% < WER ≤ 30%): {row['fair_count']:4d} samples ({row['fair_pct']:5.1f}%)\n")
+        parts.append(f"  Poor (WER > 30%):       {row['poor_count']:4d} samples ({row['poor_pct']:5.1f}%)\n\n")
         
-        # Model comparison
-        if len(comparison_df) > 1:
-            f.write("\n" + "=" * 80 + "\n")
-            f.write("MODEL COMPARISON (Ranked by Mean WER)\n")
-            f.write("=" * 80 + "\n\n")
-            
-            ranked = comparison_df.sort_values('mean')
-            for rank, (_, row) in enumerate(ranked.iterrows(), 1):
-                f.write(f"{rank}. {row['model_name']:20s} - Mean WER: {row['mean']:6.2f}% (±{row['std']:5.2f}%)\n")
+        parts.append("INTERPRETATION:\n")
+        parts.append("-" * 40 + "\n")
+        
+        # CV interpretation
+        if row['cv'] < 15:
+            cv_interp = "Low variability - highly consistent performance"
+        elif row['cv'] < 30:
+            cv_interp = "Moderate variability - reasonably consistent"
+        else:
+            cv_interp = "High variability - inconsistent performance"
+        parts.append(f"  CV: {cv_interp}\n")
+        
+        # Skewness interpretation
+        if abs(row['skewness']) < 0.5:
+            skew_interp = "Approximately symmetric distribution"
+        elif row['skewness'] > 0:
+            skew_interp = "Right-skewed - more samples with low WER"
+        else:
+            skew_interp = "Left-skewed - more samples with high WER"
+        parts.append(f"  Skewness: {skew_interp}\n")
+        
+        # Overall performance
+        if row['mean'] <= 10:
+            overall = "EXCELLENT"
+        elif row['mean'] <= 20:
+            overall = "GOOD"
+        elif row['mean'] <= 30:
+            overall = "FAIR"
+        else:
+            overall = "POOR"
+        parts.append(f"  Overall Rating: {overall}\n\n")
+    
+    # Model comparison
+    if len(comparison_df) > 1:
+        parts.append("\n" + "=" * 80 + "\n")
+        parts.append("MODEL COMPARISON (Ranked by Mean WER)\n")
+        parts.append("=" * 80 + "\n\n")
+        
+        ranked = comparison_df.sort('mean', maintain_order=True)
+        for rank, row in enumerate(ranked.to_dicts(), 1):
+            parts.append(f"{rank}. {row['model_name']:20s} - Mean WER: {row['mean']:6.2f}% (±{row['std']:5.2f}%)\n")
+    
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
     
     print(f"\nDetailed report saved: {report_file}")
 
@@ -235,6 +433,8 @@ Examples:
                         help='Specific CSV file(s) to analyze')
     parser.add_argument('-o', '--output', default='wer_analysis',
                         help='Output directory (default: wer_analysis)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompute statistics instead of reusing {output}/.cache')
     
     args = parser.parse_args()
     
@@ -260,15 +460,16 @@ Examples:
     os.makedirs(args.output, exist_ok=True)
     
     # Compare models
-    comparison_df = compare_models(csv_files)
+    cache_dir = None if args.no_cache else os.path.join(args.output, '.cache')
+    comparison_df = compare_models(csv_files, cache_dir)
     
-    if comparison_df.empty:
+    if comparison_df.is_empty():
         print("No valid data to analyze")
         return
     
     # Save comparison CSV
     comparison_file = os.path.join(args.output, 'model_comparison.csv')
-    comparison_df.to_csv(comparison_file, index=False)
+    comparison_df.write_csv(comparison_file)
     print(f"\nComparison table saved: {comparison_file}")
     
     # Generate detailed report
@@ -276,7 +477,7 @@ Examples:
     
     # Save JSON for programmatic access
     json_file = os.path.join(args.output, 'statistics.json')
-    stats_dict = comparison_df.to_dict(orient='records')
+    stats_dict = comparison_df.to_dicts()
     with open(json_file, 'w', encoding='utf-8') as f:
         json.dump(stats_dict, f, indent=2, ensure_ascii=False)
     print(f"JSON statistics saved: {json_file}")
@@ -5,12 +5,69 @@ Supports multiple model folders for comparison
 """
 
 import os
-import glob
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import jiwer
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import _wer  # optional C extension, build with: python setup.py build_ext --inplace
+except ImportError:
+    _wer = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, WER falls back to jiwer
+    njit = None
+
+# Token ids per file_id together with the vocab they were encoded with (see encode_texts)
+EncodedTexts = Tuple[Dict[str, np.ndarray], Dict[str, int]]
+
+# Whether a compiled Levenshtein backend (C extension or numba) is available
+NATIVE_WER = _wer is not None or njit is not None
+
+# Default jiwer WER transform, built once and reused for every batch
+WER_TRANSFORM = jiwer.transformations.wer_default
+
+# Below this many pairs process spawn overhead outweighs the parallel jiwer speedup
+PARALLEL_MIN_PAIRS = 2000
+
+# Threads used to read transcript files (file I/O releases the GIL)
+READ_WORKERS = 32
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _edit_distance(ref_ids, hyp_ids):
+        """Word-level Levenshtein distance (two-row DP over token ids)"""
+        prev = np.arange(hyp_ids.size + 1)
+        curr = np.empty_like(prev)
+        for i in range(1, ref_ids.size + 1):
+            curr[0] = i
+            for j in range(1, hyp_ids.size + 1):
+                cost = 0 if ref_ids[i - 1] == hyp_ids[j - 1] else 1
+                curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            prev, curr = curr, prev
+        return prev[hyp_ids.size]
+
+    @njit(cache=True, parallel=True)
+    def _edit_distances(ref_ids, ref_offsets, hyp_ids, hyp_offsets):
+        """Edit distance for every pair of the packed token arrays, in parallel"""
+        n_pairs = ref_offsets.size - 1
+        out = np.empty(n_pairs, dtype=np.int64)
+        for k in prange(n_pairs):
+            out[k] = _edit_distance(ref_ids[ref_offsets[k]:ref_offsets[k + 1]],
+                                    hyp_ids[hyp_offsets[k]:hyp_offsets[k + 1]])
+        return out
+
+
+def _read_text(filepath: str) -> str:
+    """Read one transcript; binary read + decode skips text-mode newline translation"""
+    with open(filepath, 'rb') as f:
+        return f.read().decode('utf-8').strip()
 
 
 def load_text_files(folder: str) -> Dict[str, str]:
@@ -18,92 +75,270 @@ def load_text_files(folder: str) -> Dict[str, str]:
     Load all .txt files from folder
     Returns: {file_id: text_content}
     """
-    txt_files = sorted(glob.glob(os.path.join(folder, "*.txt")))
-    data = {}
+    # Hidden files are skipped as glob does (e.g. macOS ._*.txt resource forks)
+    with os.scandir(folder) as it:
+        entries = [entry for entry in it
+                   if entry.name.endswith('.txt') and not entry.name.startswith('.') and entry.is_file()]
+    entries.sort(key=lambda entry: entry.name)
+    if not entries:
+        return {}
     
-    for filepath in txt_files:
-        file_id = Path(filepath).stem 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            text = f.read().strip()
-        data[file_id] = text
+    with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(entries))) as executor:
+        texts = executor.map(_read_text, [entry.path for entry in entries])
+        return {Path(entry.name).stem: text for entry, text in zip(entries, texts)}
+
+
+def load_manifest(filepath: str) -> Dict[str, str]:
+    """
+    Load a single-file transcript manifest (.parquet or .csv) with columns id, text
+    Returns: {file_id: text_content}
+    """
+    if filepath.endswith('.parquet'):
+        df = pd.read_parquet(filepath, columns=['id', 'text'])
+    else:
+        df = pd.read_csv(filepath, usecols=['id', 'text'], dtype=str,
+                         keep_default_na=False, encoding='utf-8')
     
-    return data
+    ids = df['id'].astype(str)
+    texts = df['text'].fillna('').astype(str).str.strip()
+    return dict(zip(ids, texts))
 
 
-def calculate_wer(reference: str, hypothesis: str) -> float:
+def load_texts(path: str) -> Dict[str, str]:
     """
-    Calculate WER between reference and hypothesis
-    Returns WER as percentage (0-100)
+    Load transcripts from a folder of .txt files or from a manifest file
+    Returns: {file_id: text_content}
+    """
+    if os.path.isdir(path):
+        return load_text_files(path)
+    return load_manifest(path)
+
+
+def _encode_words(sentences: List[List[str]], vocab: Dict[str, int]) -> List[np.ndarray]:
+    """
+    Map each sentence's words to int32 ids, growing vocab as new words are seen
+    """
+    return [np.fromiter((vocab.setdefault(word, len(vocab)) for word in words),
+                        dtype=np.int32, count=len(words))
+            for words in sentences]
+
+
+def _pack_tokens(token_ids: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate per-sentence token ids
+    Returns: (concatenated int32 ids, offsets of each sentence)
+    """
+    offsets = np.zeros(len(token_ids) + 1, dtype=np.int64)
+    np.cumsum([ids.size for ids in token_ids], out=offsets[1:])
+    ids = np.concatenate(token_ids) if token_ids else np.empty(0, dtype=np.int32)
+    return ids, offsets
+
+
+def encode_texts(texts: Dict[str, str]) -> EncodedTexts:
+    """
+    Tokenize texts with the WER transform and map words to int32 ids
+    Returns: ({file_id: token_ids}, vocab the ids refer to)
+    """
+    vocab = {}
+    file_ids = list(texts)
+    sentences = WER_TRANSFORM([texts[file_id] for file_id in file_ids])
+    return dict(zip(file_ids, _encode_words(sentences, vocab))), vocab
+
+
+def _jiwer_edit_counts(references: List[str], hypotheses: List[str]) -> Tuple[List[int], List[int]]:
     """
-    if not reference or not hypothesis:
-        return 100.0 
+    Per-utterance S + D + I and reference length from one jiwer.process_words call
+    """
+    output = jiwer.process_words(
+        references,
+        hypotheses,
+        reference_transform=WER_TRANSFORM,
+        hypothesis_transform=WER_TRANSFORM,
+    )
+    edits = [
+        sum(max(chunk.ref_end_idx - chunk.ref_start_idx, chunk.hyp_end_idx - chunk.hyp_start_idx)
+            for chunk in alignment if chunk.type != 'equal')
+        for alignment in output.alignments
+    ]
+    return edits, [len(words) for words in output.references]
+
+
+def _parallel_jiwer_edit_counts(references: List[str], hypotheses: List[str]) -> Tuple[List[int], List[int]]:
+    """
+    Split the pairs into chunks scored by _jiwer_edit_counts in a process pool
+    Small batches run serially
+    """
+    num_workers = os.cpu_count() or 1
+    if len(references) < PARALLEL_MIN_PAIRS or num_workers == 1:
+        return _jiwer_edit_counts(references, hypotheses)
+    
+    chunk_size = max(1, len(references) // (4 * num_workers))
+    starts = range(0, len(references), chunk_size)
+    
+    edits, ref_lengths = [], []
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for chunk_edits, chunk_lengths in executor.map(
+            _jiwer_edit_counts,
+            [references[start:start + chunk_size] for start in starts],
+            [hypotheses[start:start + chunk_size] for start in starts],
+        ):
+            edits.extend(chunk_edits)
+            ref_lengths.extend(chunk_lengths)
+    
+    return edits, ref_lengths
+
+
+def _fits_c_extension(vocab_size: int, ref_offsets: np.ndarray, hyp_offsets: np.ndarray) -> bool:
+    """
+    Token ids must fit uint16 and sentences must be shorter than 65535 tokens,
+    so the uint16 DP cells (up to length + 1) cannot wrap; offsets must fit int32
+    """
+    return (vocab_size <= 1 << 16
+            and max(np.diff(ref_offsets).max(), np.diff(hyp_offsets).max()) < np.iinfo(np.uint16).max
+            and max(ref_offsets[-1], hyp_offsets[-1]) < 1 << 31)
+
+
+def _native_edit_counts(references: List[str], hypotheses: List[str],
+                        reference_tokens: Optional[List[np.ndarray]] = None,
+                        vocab: Optional[Dict[str, int]] = None) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    Per-utterance edit distance and reference length from the _wer C extension,
+    or the numba Levenshtein when the batch does not fit uint16 token ids
+    Texts are tokenized with the same transform jiwer uses; reference_tokens
+    (encoded with vocab) skips re-tokenizing the references
+    Returns None when neither backend can score the batch
+    """
+    if vocab is None:
+        vocab = {}
+    if reference_tokens is None:
+        reference_tokens = _encode_words(WER_TRANSFORM(references), vocab)
+    ref_ids, ref_offsets = _pack_tokens(reference_tokens)
+    hyp_ids, hyp_offsets = _pack_tokens(_encode_words(WER_TRANSFORM(hypotheses), vocab))
+    
+    if _wer is not None and _fits_c_extension(len(vocab), ref_offsets, hyp_offsets):
+        edits = np.empty(len(references), dtype=np.int32)
+        _wer.wer_batch(ref_offsets.astype(np.int32), ref_ids.astype(np.uint16),
+                       hyp_offsets.astype(np.int32), hyp_ids.astype(np.uint16),
+                       len(references), edits)
+    elif njit is not None:
+        edits = _edit_distances(ref_ids, ref_offsets, hyp_ids, hyp_offsets)
+    else:
+        return None
+    
+    return edits.tolist(), np.diff(ref_offsets).tolist()
+
+
+def calculate_wers(references: List[str], hypotheses: List[str],
+                   reference_tokens: Optional[List[np.ndarray]] = None,
+                   vocab: Optional[Dict[str, int]] = None) -> List[float]:
+    """
+    Calculate WER for each reference/hypothesis pair in one batch
+    Uses the _wer C extension or numba Levenshtein when available,
+    otherwise jiwer over a process pool
+    reference_tokens/vocab: pre-encoded references (see encode_texts), native backends only
+    Returns WER as percentage (0-100), one per pair; pairs with an empty side score 100
+    Errors are raised for the whole batch, not handled per pair
+    """
+    scores = [100.0] * len(references)
+    valid = [i for i, (ref, hyp) in enumerate(zip(references, hypotheses)) if ref and hyp]
+    if not valid:
+        return scores
     
-    try:
-        wer = jiwer.wer(reference, hypothesis)
-        return round(wer * 100, 2)
-    except Exception as e:
-        print(f"Error calculating WER: {e}")
-        return 100.0
+    refs = [references[i] for i in valid]
+    hyps = [hypotheses[i] for i in valid]
+    counts = None
+    if NATIVE_WER:
+        ref_tokens = None
+        if reference_tokens is not None:
+            ref_tokens = [reference_tokens[i] for i in valid]
+        counts = _native_edit_counts(refs, hyps, ref_tokens, vocab)
+    if counts is None:
+        counts = _parallel_jiwer_edit_counts(refs, hyps)
+    edits, ref_lengths = counts
+    
+    for i, num_edits, ref_length in zip(valid, edits, ref_lengths):
+        if ref_length:
+            scores[i] = round(num_edits / ref_length * 100, 2)
+    
+    return scores
 
 
-def evaluate_single_model(ground_truth_folder: str, model_folder: str, model_name: str) -> pd.DataFrame:
+def evaluate_single_model(ground_truth: Dict[str, str], gt_tokens: Optional[EncodedTexts],
+                          model_folder: str, model_name: str,
+                          store_text: bool = False) -> pd.DataFrame:
     """
-    Evaluate WER for a single model against ground-truth
-    Returns DataFrame with columns: id, ground_truth, model_name, wer
+    Evaluate WER for a single model against already loaded ground-truth
+    gt_tokens: encode_texts(ground_truth) (token ids + their vocab), or None
+    Returns DataFrame with columns: id, wer
+    (id, ground_truth, model_name, wer when store_text is set)
     """
     print(f"\n=== Evaluating: {model_name} ===")
     
     # Load data
-    ground_truth = load_text_files(ground_truth_folder)
-    model_output = load_text_files(model_folder)
+    model_output = load_texts(model_folder)
     
     # Find common IDs
     common_ids = sorted(set(ground_truth.keys()) & set(model_output.keys()))
     
     if not common_ids:
-        print(f"Warning: No common files found between {ground_truth_folder} and {model_folder}")
+        print(f"Warning: No common files found between ground-truth and {model_folder}")
         return pd.DataFrame()
     
     print(f"Found {len(common_ids)} common files")
     
-    # Calculate WER for each file
-    results = []
-    for file_id in common_ids:
-        ref_text = ground_truth[file_id]
-        hyp_text = model_output[file_id]
-        wer_score = calculate_wer(ref_text, hyp_text)
-        
-        results.append({
-            'id': file_id,
-            'ground_truth': ref_text,
-            model_name: hyp_text,
-            'wer': wer_score
-        })
-    
-    df = pd.DataFrame(results)
+    # Calculate WER for all files in one batch
+    refs = [ground_truth[file_id] for file_id in common_ids]
+    hyps = [model_output[file_id] for file_id in common_ids]
+    ref_tokens = None
+    vocab = None
+    if gt_tokens is not None:
+        token_ids, gt_vocab = gt_tokens
+        ref_tokens = [token_ids[file_id] for file_id in common_ids]
+        # Copy so this model's hypothesis words do not leak into the next model's vocab
+        vocab = dict(gt_vocab)
+    wers = calculate_wers(refs, hyps, ref_tokens, vocab)
+    
+    # Build the frame column-wise; WER only has 2-decimal precision, float32 is enough
+    columns = {'id': common_ids}
+    if store_text:
+        columns['ground_truth'] = refs
+        columns[model_name] = hyps
+    columns['wer'] = np.asarray(wers, dtype=np.float32)
+    
+    df = pd.DataFrame(columns)
     print(f"Average WER: {df['wer'].mean():.2f}%")
     
     return df
 
 
-def evaluate_multiple_models(ground_truth_folder: str, model_configs: List[Dict[str, str]], output_dir: str):
+def evaluate_multiple_models(ground_truth_folder: str, model_configs: List[Dict[str, str]], output_dir: str,
+                             store_text: bool = False):
     """
     Evaluate multiple models and save individual CSV files
     
     model_configs: List of dicts with keys 'name' and 'folder'
+    store_text: also write the ground-truth and model transcripts to the CSVs
     """
     os.makedirs(output_dir, exist_ok=True)
     
+    # Load (and for the native WER backends, tokenize) ground-truth once for all models
+    ground_truth = load_texts(ground_truth_folder)
+    gt_tokens = encode_texts(ground_truth) if NATIVE_WER else None
+    
     for config in model_configs:
         model_name = config['name']
         model_folder = config['folder']
         
         if not os.path.exists(model_folder):
-            print(f"Warning: Model folder not found: {model_folder}")
+            print(f"Warning: Model folder/manifest not found: {model_folder}")
             continue
         
-        # Evaluate this model
-        df = evaluate_single_model(ground_truth_folder, model_folder, model_name)
+        # Evaluate this model; a failing model is skipped, not scored per file
+        try:
+            df = evaluate_single_model(ground_truth, gt_tokens, model_folder, model_name, store_text)
+        except Exception as e:
+            print(f"Error evaluating {model_name}: {e}")
+            continue
         
         if df.empty:
             continue
@@ -127,17 +362,22 @@ Examples:
   
   # Multiple models
   python evaluate_wer.py -g ground-truth -m xtts/text f5tts/text -n XTTS F5-TTS -o results
+  
+  # Manifest files (id,text) instead of folders of .txt files
+  python evaluate_wer.py -g ground-truth.parquet -m xtts.parquet -n XTTS -o results
         """
     )
     
     parser.add_argument('-g', '--ground-truth', required=False,default='ground-truth',
-                        help='Ground-truth folder path')
+                        help='Ground-truth folder or manifest (.parquet/.csv with id,text columns)')
     parser.add_argument('-m', '--models', nargs='+', required=True,
-                        help='Model output folder(s)')
+                        help='Model output folder(s) or manifest file(s)')
     parser.add_argument('-n', '--names', nargs='+', required=True,
                         help='Model name(s) (must match number of model folders)')
     parser.add_argument('-o', '--output', default='wer_results',
                         help='Output directory for CSV files (default: wer_results)')
+    parser.add_argument('--store-text', action=argparse.BooleanOptionalAction, default=False,
+                        help='Include ground_truth and model transcript columns in the CSVs (for debugging)')
     
     args = parser.parse_args()
     
@@ -146,7 +386,7 @@ Examples:
         parser.error("Number of model folders must match number of model names")
     
     if not os.path.exists(args.ground_truth):
-        parser.error(f"Ground-truth folder not found: {args.ground_truth}")
+        parser.error(f"Ground-truth folder/manifest not found: {args.ground_truth}")
     
     # Build model configs
     model_configs = [
@@ -155,7 +395,7 @@ Examples:
     ]
     
     # Run evaluation
-    evaluate_multiple_models(args.ground_truth, model_configs, args.output)
+    evaluate_multiple_models(args.ground_truth, model_configs, args.output, args.store_text)
 
 
 if __name__ == "__main__":
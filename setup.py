@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Build the optional _wer C extension used by evaluate_wer.py
+Usage: python setup.py build_ext --inplace
+"""
+
+import sys
+from setuptools import setup, Extension
+
+extra_compile_args = [] if sys.platform == 'win32' else ['-O3', '-march=native']
+
+setup(
+    name='wer-ext',
+    ext_modules=[Extension('_wer', ['_wer.c'], extra_compile_args=extra_compile_args)],
+)